@@ -1,12 +1,16 @@
 import logging
+import sys
 import time
 import warnings
-from collections import OrderedDict
-from itertools import chain
-from typing import Hashable, List, Mapping, Optional, Sequence, Tuple
-from weakref import WeakSet, WeakValueDictionary
+from collections import deque
+from collections.abc import Iterable
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Hashable, List, MutableMapping, Optional, Sequence, Tuple
+from weakref import WeakSet, WeakValueDictionary, finalize
 
 from ophyd import ophydobj
+from ophyd.signal import Signal
 
 try:
     from pcdsdevices.signal import _AggregateSignalState
@@ -32,30 +36,94 @@ try:
     import typhos
 except ImportError:
     typhos_available = False
+    _typhos_signal_registry = None
 else:
     typhos_available = True
+    # Bound once so hot registration paths skip the attribute chain
+    _typhos_signal_registry = typhos.plugins.core.signal_registry
+
+_add_instantiation_callback = ophydobj.OphydObject.add_instantiation_callback
 
 
 log = logging.getLogger(__name__)
 
 
+# Default classes that count as resolved ophyd objects, de-duplicated in
+# case the optional classes fall back to OphydObject
+_VALID_CLASSES = tuple(
+    dict.fromkeys(
+        (
+            ophydobj.OphydObject,
+            _AggregateSignalState,
+            AsyncDevice,
+        )
+    )
+)
+
+
 __all__ = ["Registry"]
 
 
-def is_iterable(obj):
-    return (not isinstance(obj, str)) and hasattr(obj, "__iter__")
+# Concrete types checked first so common queries skip the hasattr probe
+_ITERABLE_TYPES = (list, tuple, set, frozenset)
+
+# Edge case with EpicsMotor objects: user_readback's name is the same as
+# its parent motor
+_USER_READBACK_SUFFIX = "user_readback"
+
+# Attributes that mark a duplicate-named component as a readback of its
+# parent, resolved once per device type
+_READBACK_ATTRS = ("readback", "user_readback", "val")
+_readback_attrs_by_type: dict = {}
+
+
+def _readback_attrs(cls):
+    """Which of the readback attributes does *cls* define, cached per type."""
+    attrs = _readback_attrs_by_type.get(cls)
+    if attrs is None:
+        attrs = _readback_attrs_by_type[cls] = tuple(
+            attr for attr in _READBACK_ATTRS if hasattr(cls, attr)
+        )
+    return attrs
+
+
+@lru_cache(maxsize=1024)
+def _split_dotted(query: str) -> Tuple[str, Optional[Callable]]:
+    """Split a dotted query into its head and an attribute getter.
+
+    For example, ``"eiger_500K.cam.gain"`` becomes ``("eiger_500K",
+    attrgetter("cam.gain"))``. Queries without dots get a ``None``
+    getter. Cached so repeated lookups of the same query skip the
+    string parsing and attrgetter construction.
+
+    """
+    head, _, attrs = query.partition(".")
+    getter = attrgetter(attrs) if attrs else None
+    return head, getter
+
 
+class _OrderedSet(dict):
+    """A dict-backed set whose iteration follows insertion order.
 
-def remove_duplicates(items, key=None):
-    unique_items = list()
-    for item in items:
-        val = item if key is None else key(item)
-        if val not in unique_items:
-            yield item
-            unique_items.append(val)
+    Used for label buckets so that ``findall(label=...)`` returns
+    components in registration order instead of hash order.
 
+    """
+
+    def add(self, item):
+        self[item] = None
+
+    def discard(self, item):
+        self.pop(item, None)
 
-def register_typhos_signal(signal):
+
+def is_iterable(obj):
+    if isinstance(obj, _ITERABLE_TYPES):
+        return True
+    return (not isinstance(obj, str)) and isinstance(obj, Iterable)
+
+
+def register_typhos_signal(signal, signal_registry=None):
     """
     Add a new Signal to Typhos' registry.
 
@@ -68,33 +136,27 @@ def register_typhos_signal(signal):
     full dotted path starting from the parent's name.
     """
     # Pick all the name aliases (name, dotted path)
-    if signal is signal.root:
+    root = signal.root
+    if signal is root:
         names = (signal.name,)
     else:
         # .dotted_name does not include the root device's name
         names = (
             signal.name,
-            ".".join((signal.root.name, signal.dotted_name)),
+            f"{root.name}.{signal.dotted_name}",
         )
     # Warn the user if they are adding twice
-    signal_registry = typhos.plugins.core.signal_registry
+    if signal_registry is None:
+        signal_registry = _typhos_signal_registry
     for name in names:
-        if name in signal_registry:
-            # Case 1: harmless re-add
-            if signal_registry[name] is signal:
-                log.debug(
-                    "The signal named %s is already registered!",
-                    name,
-                )
-            # Case 2: harmful overwrite! Name collision!
-            else:
-                log.warning(
-                    "A different signal named %s is already registered!",
-                    name,
-                )
-            continue
-        else:
-            signal_registry[name] = signal
+        # One probe: either inserts the signal or returns the incumbent
+        existing = signal_registry.setdefault(name, signal)
+        if existing is not signal:
+            # Harmful overwrite! Name collision!
+            log.warning(
+                "A different signal named %s is already registered!",
+                name,
+            )
     log.debug("Registering signal with names %s", names)
 
 
@@ -123,22 +185,56 @@ class Registry:
     warn_duplicates
         If true, a warning will be issued if this device is
         overwriting a previous device with the same name.
+    lazy_subsignals
+      If true, only root devices are registered up front and their
+      sub-component trees are expanded on the first query that needs
+      them. Speeds up start-up for large device trees, at the cost
+      that ``component_names`` only includes expanded components.
+      Name queries expand only trees whose root name is a prefix of
+      the query, so a child explicitly named without its root's name
+      as a prefix is not findable with ``find(name=...)`` until
+      something forces a full expansion, such as a label or *any_of*
+      query.
 
     """
 
     use_typhos: bool
     keep_references: bool
     warn_duplicates: bool
+    lazy_subsignals: bool
     _auto_register: bool
-    _valid_classes: Tuple[type] = (
-        ophydobj.OphydObject,
-        _AggregateSignalState,
-        AsyncDevice,
-    )
+    _callback_installed: bool
+    _valid_classes: Tuple[type, ...]
 
     # components: Sequence
-    _objects_by_name: Mapping
-    _objects_by_label: Mapping
+    _objects_by_name: MutableMapping[str, ophydobj.OphydObject]
+    _objects_by_label: MutableMapping[str, set]
+
+    # Slots make every ``self.`` access a fixed-offset load and save a
+    # per-instance __dict__
+    __slots__ = (
+        "use_typhos",
+        "keep_references",
+        "warn_duplicates",
+        "lazy_subsignals",
+        "_lazy_roots",
+        "_auto_register",
+        "_callback_installed",
+        "_callback_token",
+        "_valid_classes",
+        "_objects_by_name",
+        "_objects_by_label",
+        "_names_by_id",
+        "_labels_by_id",
+        "_root_devices",
+        "_version",
+        "_cache",
+        "_resolved_type_cache",
+        "_find_cache",
+        "_bucket_factory",
+        "_typhos_signal_registry",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -146,13 +242,24 @@ class Registry:
         use_typhos: bool = False,
         keep_references: bool = True,
         warn_duplicates: bool = True,
+        lazy_subsignals: bool = False,
     ):
         # Check that Typhos is installed if needed
         if use_typhos and not typhos_available:
             raise ModuleNotFoundError("No module named 'typhos'")
+        if use_typhos:
+            # Bind the Typhos signal registry once, instead of
+            # traversing the module attributes on every register() call
+            self._typhos_signal_registry = _typhos_signal_registry
         # Set up empty lists and things for registering components
+        self._callback_installed = False
+        self._valid_classes = _VALID_CLASSES
+        # Label buckets hold strong or weak references depending on
+        # *keep_references*; decide once instead of per registration
+        self._bucket_factory = _OrderedSet if keep_references else WeakSet
         self.keep_references = keep_references
         self.use_typhos = use_typhos
+        self.lazy_subsignals = lazy_subsignals
         self.clear()
         self.auto_register = auto_register
         self.warn_duplicates = warn_duplicates
@@ -165,18 +272,20 @@ class Registry:
     def auto_register(self, val):
         """Turn on or off the automatic registration of new devices."""
         self._auto_register = val
-        if val:
+        if val and not self._callback_installed:
+            # Keep the one bound method we subscribed, so it can later
+            # be removed by identity
+            self._callback_token = self.register
             # Add a callback to get notified of new objects
-            ophydobj.OphydObject.add_instantiation_callback(
-                self.register, fail_if_late=False
-            )
-        else:
-            try:
-                ophydobj.OphydObject._OphydObject__instantiation_callbacks.remove(
-                    self.register
-                )
-            except ValueError:
-                pass
+            _add_instantiation_callback(self._callback_token, fail_if_late=False)
+            self._callback_installed = True
+        elif not val and self._callback_installed:
+            callbacks = ophydobj.OphydObject._OphydObject__instantiation_callbacks
+            for index in range(len(callbacks) - 1, -1, -1):
+                if callbacks[index] is self._callback_token:
+                    del callbacks[index]
+                    break
+            self._callback_installed = False
 
     def __getitem__(self, key):
         """Retrieve the object from the dicionary.
@@ -213,20 +322,41 @@ class Registry:
                 return default
             else:
                 raise
+        # Gather the object and its descendants, then remove them all
+        # in a single pass
+        queue = deque([obj])
+        while queue:
+            target = queue.popleft()
+            self._pop_one(target)
+            sub_signals = getattr(target, "_signals", {})
+            queue.extend(cpt for cpt_name, cpt in sub_signals.items())
+        self._version += 1
+        # Drop the memoized snapshots too, so they don't keep strong
+        # references to the popped devices until the next read
+        self._cache.clear()
+        self._find_cache.clear()
+        return obj
+
+    def _pop_one(self, obj):
+        """Remove a single object from the lookup tables."""
         # Remove from the list by name
+        old_name = self._names_by_id.pop(id(obj), getattr(obj, "name", None))
+        self._lazy_roots.pop(old_name, None)
         try:
-            del self._objects_by_name[obj.name]
-        except (KeyError, AttributeError):
+            del self._objects_by_name[old_name]
+        except KeyError:
             pass
         # Remove from the list by label
-        if isinstance(obj, Hashable):
-            for objects in self._objects_by_label.values():
+        for label in self._labels_by_id.pop(id(obj), ()):
+            objects = self._objects_by_label.get(label)
+            if objects is not None:
                 objects.discard(obj)
-        # Remove children from the lists as well
-        sub_signals = getattr(obj, "_signals", {})
-        for cpt_name, cpt in sub_signals.items():
-            self.pop(cpt)
-        return obj
+                if len(objects) == 0:
+                    del self._objects_by_label[label]
+        try:
+            self._root_devices.discard(obj)
+        except TypeError:
+            pass
 
     def clear(self, clear_typhos: bool = True):
         """Remove all previously registered components.
@@ -238,13 +368,63 @@ class Registry:
           *self.use_typhos* is false.
 
         """
-        self._objects_by_label = OrderedDict()
+        self._objects_by_label = {}
         if self.keep_references:
-            self._objects_by_name = OrderedDict()
+            self._objects_by_name = {}
         else:
             self._objects_by_name = WeakValueDictionary()
+        # Reverse indices, keyed on id(), so that we can find where a
+        # component is registered without scanning the whole registry
+        self._names_by_id = {}
+        self._labels_by_id = {}
+        # Maintained incrementally so the root_devices property never
+        # has to rescan the whole name table
+        self._root_devices = set() if self.keep_references else WeakSet()
+        # Monotonic counter for invalidating memoized properties
+        self._version = 0
+        self._cache = {}
+        # Per-type memo for _is_resolved()
+        self._resolved_type_cache = {}
+        # Weak memo of resolved string queries; invalidated whenever
+        # the registry changes and never pins devices
+        self._find_cache = WeakValueDictionary()
+        # Devices whose sub-components have not been registered yet,
+        # keyed on device name (only used if *lazy_subsignals* is true)
+        self._lazy_roots = {}
         if clear_typhos and self.use_typhos:
-            typhos.plugins.core.signal_registry.clear()
+            self._typhos_signal_registry.clear()
+
+    def _cleanup(self, obj_id: int, labels: Tuple[str, ...]):
+        """Purge a garbage-collected component from the lookup tables.
+
+        Only used when *keep_references* is false. The weak containers
+        drop the component itself, but the reverse indices and any
+        now-empty label buckets still need to be evicted.
+
+        """
+        self._names_by_id.pop(obj_id, None)
+        self._labels_by_id.pop(obj_id, None)
+        for label in labels:
+            objects = self._objects_by_label.get(label)
+            # This callback fires before the WeakSet's own, so the dying
+            # member still counts toward len(); iteration skips dead
+            # references and so sees the bucket as it will end up
+            if objects is not None and next(iter(objects), None) is None:
+                del self._objects_by_label[label]
+        self._version += 1
+        self._find_cache.clear()
+
+    def _memoized(self, key, factory):
+        """Return *factory()*, cached until the registry next changes."""
+        if not self.keep_references:
+            # Caching would hold strong references to devices that are
+            # supposed to be dropped by the garbage collector
+            return factory()
+        version, value = self._cache.get(key, (-1, None))
+        if version != self._version:
+            value = factory()
+            self._cache[key] = (self._version, value)
+        return value
 
     def pop_disconnected(self, timeout: float = 0.0) -> List:
         """Remove any registered objects that are disconnected.
@@ -260,39 +440,54 @@ class Registry:
           The root level devices that were removed.
 
         """
-        remaining = [dev for dev in self.root_devices]
+        remaining = list(self.root_devices)
         t0 = time.monotonic()
-        timeout_reached = False
-        while not timeout_reached:
-            # Remove any connected devices for the running list
-            remaining = [
-                dev for dev in remaining if not getattr(dev, "connected", True)
-            ]
+        # Poll with exponential backoff so large registries don't burn
+        # CPU re-checking attributes every few milliseconds
+        sleep_time = 0.01
+        while True:
+            # Drop connected devices in place, swapping with the last
+            # element so no per-poll list is allocated
+            index = 0
+            while index < len(remaining):
+                if getattr(remaining[index], "connected", True):
+                    remaining[index] = remaining[-1]
+                    remaining.pop()
+                else:
+                    index += 1
             if len(remaining) == 0:
                 # All devices are connected, so just end early.
                 break
-            time.sleep(min((0.05, timeout / 10.0)))
-            timeout_reached = (time.monotonic() - t0) > timeout
+            if (time.monotonic() - t0) > timeout:
+                break
+            time.sleep(min(sleep_time, 0.25))
+            sleep_time *= 2
         # Remove unconnected devices from the registry
         popped = [self.pop(dev) for dev in remaining]
         return popped
 
     @property
     def component_names(self):
-        return set(self._objects_by_name.keys())
+        """The names of all registered components, as a set-like view.
+
+        The view supports iteration, ``len()``, membership tests and
+        comparison against sets without copying the keys.
+
+        """
+        return self._objects_by_name.keys()
 
     @property
     def root_devices(self):
         """Only return root devices, those without parents."""
-        return set(
-            dev for name, dev in self._objects_by_name.items() if dev.parent is None
-        )
+        # Frozen so the cached value can be handed out without giving
+        # callers a mutable alias of the memo
+        return self._memoized("root_devices", lambda: frozenset(self._root_devices))
 
     @property
     def device_names(self):
         """Only return root devices, those without parents."""
-        return set(
-            [name for name, dev in self._objects_by_name.items() if dev.parent is None]
+        return self._memoized(
+            "device_names", lambda: frozenset(dev.name for dev in self._root_devices)
         )
 
     def find(
@@ -346,20 +541,73 @@ class Registry:
           ``self.findall()`` method.
 
         """
-        results = list(
-            self.findall(any_of=any_of, label=label, name=name, allow_none=allow_none)
+        # Fast path: a plain, non-dotted name query is a single dict
+        # probe, with no generator or de-duplication machinery
+        if any_of is None and label is None and isinstance(name, str):
+            if "." not in name and not name.endswith("user_readback"):
+                result = self._objects_by_name.get(name)
+                if result is None and self._expand_lazy(name):
+                    result = self._objects_by_name.get(name)
+                if result is not None:
+                    return result
+                elif allow_none:
+                    return None
+                else:
+                    raise ComponentNotFound(
+                        f'Could not find components matching: label="{label}", name="{name}"'
+                    )
+        # Fast path: a plain string *any_of* that collides with no
+        # label is just a name lookup, so resolve it with one probe of
+        # each table instead of the generator machinery
+        if (
+            label is None
+            and name is None
+            and isinstance(any_of, str)
+            and not self._lazy_roots
+            and "." not in any_of
+            and not any_of.endswith(_USER_READBACK_SUFFIX)
+            and any_of not in self._objects_by_label
+        ):
+            result = self._objects_by_name.get(any_of)
+            if result is not None:
+                return result
+            # A miss falls through to the general path for error handling
+        # Check the memo of previously resolved string queries
+        use_cache = label is None and name is None and isinstance(any_of, str)
+        if use_cache:
+            cached = self._find_cache.get(any_of)
+            if cached is not None:
+                return cached
+        # Pull at most two matches; a unique hit never pays for
+        # materializing and de-duplicating the full result list
+        matches = self._iter_matches(
+            any_of=any_of, label=label, name=name, allow_none=allow_none
         )
-        if len(results) == 1:
-            result = results[0]
-        elif len(results) > 1:
+        first = next(matches, UNSET)
+        if first is UNSET:
+            if allow_none:
+                return None
+            _label = label if label is not None else any_of
+            _name = name if name is not None else any_of
+            raise ComponentNotFound(
+                f'Could not find components matching: label="{_label}", name="{_name}"'
+            )
+        second = next(matches, UNSET)
+        if second is not UNSET:
+            results = [first, second, *matches]
             raise MultipleComponentsFound(
                 f"Found {len(results)} components matching query "
                 f"[any_of={any_of}, label={label}, name={name}]. "
                 "Consider using ``findall()``. "
                 f"{results}"
             )
-        else:
-            result = None
+        result = first
+        if use_cache:
+            try:
+                self._find_cache[any_of] = result
+            except TypeError:
+                # Not everything can be weakly referenced
+                pass
         return result
 
     def _is_resolved(self, obj):
@@ -367,12 +615,17 @@ class Registry:
 
         This method checks the type of the object. To extend this to
         other types of objects, override this objects
-        ``_valid_classes`` attribute with a new set.
+        ``_valid_classes`` attribute with a new set. The verdict is
+        cached per type; ``clear()`` resets the cache.
 
         """
-        if isinstance(obj, self._valid_classes):
-            return True
-        return False
+        cls = type(obj)
+        resolved = self._resolved_type_cache.get(cls)
+        if resolved is None:
+            resolved = self._resolved_type_cache[cls] = isinstance(
+                obj, self._valid_classes
+            )
+        return resolved
 
     def _findall_by_label(self, label, allow_none):
         # Check for already created ophyd objects (return as is)
@@ -382,24 +635,33 @@ class Registry:
         # Recursively get lists of components
         if is_iterable(label):
             for lbl in label:
-                yield from self.findall(label=lbl, allow_none=allow_none)
+                found = False
+                for device in self._iter_matches(
+                    any_of=None, label=lbl, name=None, allow_none=allow_none
+                ):
+                    found = True
+                    yield device
+                if not found and not allow_none:
+                    raise ComponentNotFound(
+                        f'Could not find components matching: label="{lbl}", name="None"'
+                    )
         else:
             # Split off label attributes
+            if isinstance(label, str):
+                label, getter = _split_dotted(label)
+            else:
+                getter = None
+            # Deferred sub-components may carry labels of their own,
+            # so all trees have to be expanded before a label query
+            self._expand_lazy()
             try:
-                label, *attrs = label.split(".")
-            except AttributeError:
-                attrs = []
-            try:
-                for cpt_ in self._objects_by_label[label]:
-                    # Re-apply the dot-notation filter
-                    for attr in attrs:
-                        cpt_ = getattr(cpt_, attr)
-                    yield cpt_
-            except KeyError:
-                # No components found so just move on
-                pass
+                components = self._objects_by_label.get(label)
             except TypeError:
                 raise InvalidComponentLabel(label)
+            # *components* is None if no matches were found
+            if components is not None:
+                for cpt_ in components:
+                    yield cpt_ if getter is None else getter(cpt_)
 
     def _findall_by_name(self, name):
         # Check for already created ophyd objects (return as is)
@@ -407,32 +669,37 @@ class Registry:
             yield name
             return
         # Check for an edge case with EpicsMotor objects (user_readback name is same as parent)
-        try:
-            is_user_readback = name[-13:] == "user_readback"
-        except TypeError:
-            is_user_readback = False
+        is_user_readback = isinstance(name, str) and name.endswith(
+            _USER_READBACK_SUFFIX
+        )
         if is_user_readback:
-            parentname = name[:-14].strip("_")
+            parentname = name[: -len(_USER_READBACK_SUFFIX)].rstrip("_")
             yield self.find(name=parentname).user_readback
         elif is_iterable(name):
             for n in name:
-                yield from self.findall(name=n)
+                found = False
+                for device in self._iter_matches(
+                    any_of=None, label=None, name=n, allow_none=False
+                ):
+                    found = True
+                    yield device
+                if not found:
+                    raise ComponentNotFound(
+                        f'Could not find components matching: label="None", name="{n}"'
+                    )
         else:
             # Split off any dot notation parameters for later filtering
-            try:
-                name, *attrs = name.split(".")
-            except AttributeError:
-                attrs = []
-            # Find the matching components
-            try:
-                cpt_ = self._objects_by_name[name]
-            except KeyError:
-                pass
+            if isinstance(name, str):
+                name, getter = _split_dotted(name)
             else:
+                getter = None
+            # Find the matching components
+            cpt_ = self._objects_by_name.get(name)
+            if cpt_ is None and self._expand_lazy(name):
+                cpt_ = self._objects_by_name.get(name)
+            if cpt_ is not None:
                 # Re-apply dot-notation filter
-                for attr in attrs:
-                    cpt_ = getattr(cpt_, attr)
-                yield cpt_
+                yield cpt_ if getter is None else getter(cpt_)
 
     def findall(
         self,
@@ -484,45 +751,95 @@ class Registry:
           parameters.
 
         """
-        results = []
+        # An already-resolved ophyd object just passes through, skipping
+        # the name/label generators and the de-duplication pass
+        if any_of is not None and self._is_resolved(any_of):
+            return [any_of]
+        results = list(
+            self._iter_matches(
+                any_of=any_of, label=label, name=name, allow_none=allow_none
+            )
+        )
+        if not results:
+            # No results were found
+            if allow_none:
+                return []
+            else:
+                _label = label if label is not None else any_of
+                _name = name if name is not None else any_of
+                raise ComponentNotFound(
+                    f'Could not find components matching: label="{_label}", name="{_name}"'
+                )
+        return results
+
+    def _iter_matches(self, any_of, label, name, allow_none):
+        """Yield components matching the query, lazily and de-duplicated.
+
+        Shared by ``find()`` and ``findall()``; callers decide how many
+        matches they need and whether an empty result is an error.
+
+        """
+        if any_of is not None and self._is_resolved(any_of):
+            yield any_of
+            return
         # If using *any_of*, search by label and name
         _label = label if label is not None else any_of
         _name = name if name is not None else any_of
+        # De-duplicate as we yield. Key on id() so that unhashable
+        # components are still allowed.
+        seen = set()
         # Apply several filters against label, name, etc.
         if is_iterable(any_of):
             for a in any_of:
-                results.append(self.findall(any_of=a, allow_none=allow_none))
+                # Recurse through the generator directly so each
+                # element skips findall's list building, but keep the
+                # per-element missing-component check
+                found = False
+                for device in self._iter_matches(
+                    any_of=a, label=None, name=None, allow_none=allow_none
+                ):
+                    found = True
+                    if id(device) not in seen:
+                        seen.add(id(device))
+                        yield device
+                if not found and not allow_none:
+                    raise ComponentNotFound(
+                        f'Could not find components matching: label="{a}", name="{a}"'
+                    )
         else:
             # Filter by label
             if _label is not None:
-                results.append(self._findall_by_label(_label, allow_none=allow_none))
+                for device in self._findall_by_label(_label, allow_none=allow_none):
+                    if id(device) not in seen:
+                        seen.add(id(device))
+                        yield device
             # Filter by name
             if _name is not None:
-                results.append(self._findall_by_name(_name))
-        # Peek at the first item to check for an empty result
-        results = chain(*results)
-        try:
-            first = next(results)
-        except StopIteration:
-            # No results were found
-            if allow_none:
-                results = []
-            else:
-                raise ComponentNotFound(
-                    f'Could not find components matching: label="{_label}", name="{_name}"'
-                )
-        else:
-            # Stick the first entry back in the queue and yield it
-            results = chain([first], results)
-        return list(remove_duplicates(results))
-
-    def __new__wrapper(self, cls, *args, **kwargs):
-        # Create and instantiate the new object
-        obj = super(type, cls).__new__(cls)
-        obj.__init__(*args, **kwargs)
-        # Register the new object
-        self.register(obj)
-        return obj
+                for device in self._findall_by_name(_name):
+                    if id(device) not in seen:
+                        seen.add(id(device))
+                        yield device
+
+    def _make_new_wrapper(self, cls):
+        """Build a specialized ``__new__`` for auto-registering *cls*.
+
+        The allocator and our ``register`` method are captured in the
+        closure, so instance creation skips building a ``super`` proxy
+        on every call.
+
+        """
+        base_new = object.__new__
+        register = self.register
+
+        def __new__(wrapped_cls, *args, **kwargs):
+            # Create and instantiate the new object
+            obj = base_new(wrapped_cls)
+            obj.__init__(*args, **kwargs)
+            # Register the new object
+            register(obj)
+            return obj
+
+        return __new__
 
     def register(
         self,
@@ -554,86 +871,210 @@ class Registry:
         # Determine how to register the device
         if isinstance(component, type):
             # A class was given, so instances should be auto-registered
-            component.__new__ = self.__new__wrapper
-        else:  # An instance was given, so just save it in the register
-            try:
-                name = component.name
-            except AttributeError:
-                msg = f"Skipping unnamed component {component}"
-                if isinstance(component, _AggregateSignalState):
-                    log.debug(msg)
+            component.__new__ = self._make_new_wrapper(component)
+        else:
+            # An instance was given, so save it and its children in the
+            # register. An explicit queue avoids Python recursion
+            # overhead for deeply nested devices, and the bound method
+            # is hoisted so large trees skip the attribute load per node
+            queue = deque([(component, labels, warn_duplicates)])
+            register_one = self._register_one
+            pop_next = queue.popleft
+            while queue:
+                cpt, cpt_labels, warn = pop_next()
+                register_one(cpt, cpt_labels, warn, queue)
+        return component
+
+    def register_many(
+        self,
+        components: Sequence[ophydobj.OphydObject],
+        labels: Optional[Sequence] = None,
+        warn_duplicates=None,
+    ) -> Sequence[ophydobj.OphydObject]:
+        """Register several device instances in a single pass.
+
+        Equivalent to calling :py:meth:`register` for each item of
+        *components*, but the whole batch shares one registration loop.
+        Unlike :py:meth:`register`, classes are not accepted.
+
+        Returns
+        =======
+        components
+          The same components as were provided as an input.
+        labels
+          Device labels to use for registration. If `None` (default),
+          each device's *_ophyd_labels_* parameter will be used.
+        warn_duplicates
+          If true, a warning will be issued if a device is overwriting
+          a previous device with the same name.
+          If None, defaults to the value of the same-named class attribute.
+
+        """
+        if warn_duplicates is None:
+            warn_duplicates = self.warn_duplicates
+        queue = deque((cpt, labels, warn_duplicates) for cpt in components)
+        register_one = self._register_one
+        pop_next = queue.popleft
+        while queue:
+            cpt, cpt_labels, warn = pop_next()
+            register_one(cpt, cpt_labels, warn, queue)
+        return components
+
+    def _register_one(
+        self,
+        component: ophydobj.OphydObject,
+        labels: Optional[Sequence],
+        warn_duplicates: bool,
+        queue: deque,
+    ) -> None:
+        """Register a single instance, adding its children to *queue*."""
+        try:
+            name = component.name
+        except AttributeError:
+            msg = f"Skipping unnamed component {component}"
+            if isinstance(component, _AggregateSignalState):
+                log.debug(msg)
+            else:
+                log.info(msg)
+            return
+        # Register this object with Typhos
+        if self.use_typhos:
+            register_typhos_signal(component, self._typhos_signal_registry)
+        # Ignore any instances with the same name as a previous component
+        # (Needed for some sub-components that are just readback
+        # values of the parent)
+        # Check if we're adding a duplicate component name
+        is_duplicate = False
+        old_obj = self._objects_by_name.get(name)
+        if old_obj is not None:
+            # Only probe the readback attributes this type actually has;
+            # for most types that is none at all
+            is_readback = any(
+                component is getattr(old_obj, attr, None)
+                for attr in _readback_attrs(type(old_obj))
+            )
+            if is_readback:
+                msg = f"Ignoring readback with duplicate name: '{name}'"
+                log.debug(msg)
+                return
+            elif old_obj is component:
+                msg = f"Ignoring previously registered component: '{name}'"
+                log.debug(msg)
+                return
+            else:
+                msg = f"Ignoring component with duplicate name: '{name}'"
+                is_duplicate = True
+                if warn_duplicates:
+                    log.warning(msg)
+                    warnings.warn(msg)
                 else:
-                    log.info(msg)
-                return component
-            # Register this object with Typhos
-            if self.use_typhos:
-                register_typhos_signal(component)
-            # Ignore any instances with the same name as a previous component
-            # (Needed for some sub-components that are just readback
-            # values of the parent)
-            # Check if we're adding a duplicate component name
-            is_duplicate = False
-            if name in self._objects_by_name.keys():
-                old_obj = self._objects_by_name[name]
-                is_readback = component in [
-                    getattr(old_obj, "readback", None),
-                    getattr(old_obj, "user_readback", None),
-                    getattr(old_obj, "val", None),
-                ]
-                if is_readback:
-                    msg = f"Ignoring readback with duplicate name: '{name}'"
-                    log.debug(msg)
-                    return component
-                elif old_obj is component:
-                    msg = f"Ignoring previously registered component: '{name}'"
                     log.debug(msg)
-                    return component
-                else:
-                    msg = f"Ignoring component with duplicate name: '{name}'"
-                    is_duplicate = True
-                    if warn_duplicates:
-                        log.warning(msg)
-                        warnings.warn(msg)
-                    else:
-                        log.debug(msg)
-            # Register this component
-            log.debug(f"Registering {name}")
-            # Check if this device was previously registered with a
-            # different name
-            old_keys = [
-                key for key, val in self._objects_by_name.items() if val is component
-            ]
-            for old_key in old_keys:
-                del self._objects_by_name[old_key]
-            # Register by name
-            if component.name != "":
-                self._objects_by_name[component.name] = component
-            # Create a set for this device's labels if it doesn't exist
-            if labels is None:
-                ophyd_labels = getattr(component, "_ophyd_labels_", [])
-            else:
-                ophyd_labels = labels
-            for label in ophyd_labels:
-                if label not in self._objects_by_label.keys():
-                    if self.keep_references:
-                        self._objects_by_label[label] = set()
-                    else:
-                        self._objects_by_label[label] = WeakSet()
-                self._objects_by_label[label].add(component)
-            # Register this object with Typhos
-            if self.use_typhos:
-                import typhos
-
-                typhos.plugins.register_signal(component)
-            # Recusively register sub-components
-            if hasattr(component, "_signals"):
-                # Vanilla ophyd device
-                sub_signals = component._signals.items()
-            elif hasattr(component, "children"):
+        # Register this component
+        log.debug(f"Registering {name}")
+        # Check if this device was previously registered with a
+        # different name. The reverse index can be stale after a
+        # duplicate-name collision, so only evict an entry that still
+        # points at this component
+        old_key = self._names_by_id.get(id(component))
+        if old_key is not None and self._objects_by_name.get(old_key) is component:
+            self._objects_by_name.pop(old_key, None)
+        # Register by name
+        if component.name != "":
+            self._objects_by_name[component.name] = component
+            self._names_by_id[id(component)] = component.name
+            if getattr(component, "parent", None) is None:
+                try:
+                    self._root_devices.add(component)
+                except TypeError:
+                    # Unhashable components can't be tracked as roots
+                    pass
+        # Read the device's labels once, normalized to a tuple so they
+        # can safely be iterated again by the finalizer below
+        if labels is None:
+            ophyd_labels = tuple(getattr(component, "_ophyd_labels_", ()))
+        else:
+            ophyd_labels = tuple(labels)
+        # Unhashable components can't be stored in the label sets, so
+        # skip their labels instead of raising a TypeError
+        if ophyd_labels and not isinstance(component, Hashable):
+            log.debug(f"Skipping labels for unhashable component: '{name}'")
+            ophyd_labels = []
+        new_bucket = self._bucket_factory
+        for label in ophyd_labels:
+            if type(label) is str:
+                # The same labels repeat across thousands of signals;
+                # interning makes the dict probes identity comparisons
+                label = sys.intern(label)
+            bucket = self._objects_by_label.get(label)
+            if bucket is None:
+                bucket = self._objects_by_label[label] = new_bucket()
+            bucket.add(component)
+            self._labels_by_id.setdefault(id(component), set()).add(label)
+        # Clean up the lookup tables once the component gets
+        # garbage collected
+        if not self.keep_references:
+            finalize(component, self._cleanup, id(component), ophyd_labels)
+        self._version += 1
+        self._cache.clear()
+        self._find_cache.clear()
+        # Queue up sub-components for registration as well
+        child_warn = not is_duplicate and warn_duplicates
+        if self.lazy_subsignals and not isinstance(component, Signal):
+            # Defer walking the sub-component tree until a query
+            # actually needs it
+            self._lazy_roots[name] = (component, child_warn)
+            return
+        for cpt in self._child_components(component):
+            queue.append((cpt, None, child_warn))
+
+    def _expand_lazy(self, query: Optional[str] = None) -> bool:
+        """Register deferred sub-component trees.
+
+        If *query* is a device name (or dotted component name), only
+        trees whose root could produce that name are expanded;
+        otherwise every deferred tree is expanded. Returns true if any
+        new components were registered.
+
+        """
+        if not self._lazy_roots:
+            return False
+        expanded = False
+        # Expanding a tree may defer its own sub-trees, so keep going
+        # until a pass makes no progress
+        progress = True
+        while progress:
+            progress = False
+            for root_name in list(self._lazy_roots):
+                if not (
+                    query is None or query == root_name or query.startswith(root_name)
+                ):
+                    continue
+                component, warn = self._lazy_roots.pop(root_name)
+                queue = deque(
+                    (cpt, None, warn) for cpt in self._child_components(component)
+                )
+                while queue:
+                    cpt, cpt_labels, cpt_warn = queue.popleft()
+                    self._register_one(cpt, cpt_labels, cpt_warn, queue)
+                progress = expanded = True
+        return expanded
+
+    @staticmethod
+    def _child_components(component):
+        """Iterate over the sub-components of *component*, if any."""
+        # Bare signals are leaves, so don't probe them for sub-components
+        if isinstance(component, Signal):
+            return
+        sub_signals = getattr(component, "_signals", None)
+        if sub_signals is not None:
+            # Vanilla ophyd device
+            sub_signals = sub_signals.items()
+        else:
+            children = getattr(component, "children", None)
+            if children is not None:
                 # Ophyd-async device
-                sub_signals = component.children()
+                sub_signals = children()
             else:
-                sub_signals = []
-            for cpt_name, cpt in sub_signals:
-                self.register(cpt, warn_duplicates=not is_duplicate and warn_duplicates)
-        return component
+                sub_signals = ()
+        for cpt_name, cpt in sub_signals:
+            yield cpt
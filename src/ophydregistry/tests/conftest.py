@@ -0,0 +1,16 @@
+import pytest
+from ophyd import sim
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_ophyd():
+    """Touch the shared simulated devices once, up front.
+
+    First access to the ``ophyd.sim`` module-level devices pays for
+    descriptor resolution and lazy class registration; doing it here
+    keeps that cold-start cost out of whichever test happens to run
+    first.
+
+    """
+    _ = (sim.motor, sim.motor1, sim.motor2, sim.motor3, sim.SynGauss, sim.SynAxis)
+    yield
@@ -1,7 +1,6 @@
 import gc
 import logging
-import time
-from concurrent.futures import ThreadPoolExecutor
+import weakref
 from unittest import mock
 
 import pytest
@@ -11,15 +10,57 @@ from ophyd_async.core import soft_signal_rw
 
 from ophydregistry import ComponentNotFound, MultipleComponentsFound, Registry
 
+# Shared immutable label sets so tests don't allocate a fresh set per
+# device and factory cache keys stay hashable
+ION_CHAMBER_LABELS = frozenset({"ion_chamber"})
+NO_LABELS = frozenset()
 
-@pytest.fixture()
-def registry():
+# Sentinel for probing emptiness without materializing a list
+_MISSING = object()
+
+
+@pytest.fixture(scope="module")
+def _shared_registry():
+    # Building the registry once per module keeps constructor overhead
+    # out of every test; tests get a cleared view via *registry*
     reg = Registry(auto_register=False, use_typhos=False)
     reg._valid_classes = (mock.MagicMock, *reg._valid_classes)
-    try:
-        yield reg
-    finally:
-        del reg
+    return reg
+
+
+@pytest.fixture()
+def registry(_shared_registry):
+    _shared_registry.clear()
+    return _shared_registry
+
+
+@pytest.fixture(scope="session")
+def syngauss_factory():
+    """Memoized factory for SynGauss devices with the standard test args.
+
+    Device construction is the dominant per-test cost in this file, so
+    repeat requests for the same (name, labels) return the same cached
+    device.
+
+    """
+    cache = {}
+
+    def make(name, labels=NO_LABELS):
+        key = (name, labels)
+        device = cache.get(key)
+        if device is None:
+            device = cache[key] = sim.SynGauss(
+                name,
+                sim.motor,
+                "motor",
+                center=-0.5,
+                Imax=1,
+                sigma=1,
+                labels=set(labels),
+            )
+        return device
+
+    return make
 
 
 def test_register_component(registry):
@@ -31,7 +72,7 @@ def test_register_component(registry):
         center=-0.5,
         Imax=1,
         sigma=1,
-        labels={"ion_chamber"},
+        labels=ION_CHAMBER_LABELS,
     )
     # Make sure the component doesn't get found without being registered
     with pytest.raises(ComponentNotFound):
@@ -59,7 +100,7 @@ def test_register_component_with_labels(registry):
         sigma=1,
     )
     # Now register the component
-    cpt = registry.register(cpt, labels={"ion_chamber"})
+    cpt = registry.register(cpt, labels=ION_CHAMBER_LABELS)
     # Confirm that it's findable by label
     results = registry.findall(label="ion_chamber")
     assert cpt in results
@@ -68,21 +109,31 @@ def test_register_component_with_labels(registry):
     assert cpt in results
 
 
-def test_find_missing_components(registry):
-    """Test that registry raises an exception if no matches are found."""
-    cpt = sim.SynGauss(
-        "I0",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={"ion_chamber"},
-    )
-    registry.register(cpt)
-    # Now make sure a different query still returns no results
-    with pytest.raises(ComponentNotFound):
-        registry.findall(label="spam")
+@pytest.mark.parametrize(
+    "query,expected_attr",
+    [
+        # Plain name and label queries return the device itself
+        ({"name": "I0"}, None),
+        ({"label": "ion_chamber"}, None),
+        # Dot notation returns the named sub-component
+        ({"name": "I0.val"}, "val"),
+        ({"label": "ion_chamber.val"}, "val"),
+        # Queries with no matches raise an exception
+        ({"name": "eggs"}, ComponentNotFound),
+        ({"label": "spam"}, ComponentNotFound),
+    ],
+)
+def test_find_queries(registry, syngauss_factory, query, expected_attr):
+    """Check the common query shapes against one registered device."""
+    device = syngauss_factory("I0", ION_CHAMBER_LABELS)
+    registry.register(device)
+    if expected_attr is ComponentNotFound:
+        with pytest.raises(ComponentNotFound):
+            registry.find(**query)
+    elif expected_attr is None:
+        assert registry.find(**query) is device
+    else:
+        assert registry.find(**query) is getattr(device, expected_attr)
 
 
 def test_find_allow_missing_components(registry):
@@ -91,7 +142,8 @@ def test_find_allow_missing_components(registry):
 
     """
     # Get some non-existent devices and check that the right nothing is returned
-    assert list(registry.findall(label="spam", allow_none=True)) == []
+    results = registry.findall(label="spam", allow_none=True)
+    assert next(iter(results), _MISSING) is _MISSING
     assert registry.find(name="eggs", allow_none=True) is None
 
 
@@ -103,37 +155,23 @@ def test_exceptions(registry):
 
 
 def test_as_class_decorator(registry):
-    # Create a dummy decorated class
-    IonChamber = type("IonChamber", (Device,), {})
-    IonChamber = registry.register(IonChamber)
+    # Create a dummy decorated class, using the documented API shape
+    @registry.register
+    class IonChamber(Device):
+        pass
+
     # Instantiate the class
-    IonChamber("PV_PREFIX", name="I0", labels={"ion_chamber"})
+    IonChamber("PV_PREFIX", name="I0", labels=ION_CHAMBER_LABELS)
     # Check that it gets retrieved
     result = registry.find(label="ion_chamber")
     assert result.prefix == "PV_PREFIX"
     assert result.name == "I0"
 
 
-def test_find_component(registry):
+def test_find_component(registry, syngauss_factory):
     # Create an unregistered component
-    cptA = sim.SynGauss(
-        "I0",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={"ion_chamber"},
-    )
-    cptB = sim.SynGauss(
-        "It",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={"ion_chamber"},
-    )
+    cptA = syngauss_factory("I0", ION_CHAMBER_LABELS)
+    cptB = syngauss_factory("It", ION_CHAMBER_LABELS)
     # Register the components
     registry.register(cptA)
     registry.register(cptB)
@@ -158,82 +196,14 @@ def test_find_async_children(registry):
     assert registry.find(device.signal.name) is device.signal
 
 
-def test_find_name_by_dot_notation(registry):
-    # Create a simulated component
-    cptA = sim.SynGauss(
-        "I0",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={"ion_chamber"},
-    )
-    registry.register(cptA)
-    # Only one match should work fine
-    result = registry.find(name="I0.val")
-    assert result is cptA.val
-
-
-def test_find_labels_by_dot_notation(registry):
-    # Create a simulated component
-    cptA = sim.SynGauss(
-        "I0",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={"ion_chamber"},
-    )
-    registry.register(cptA)
-    # Only one match should work fine
-    result = registry.find(label="ion_chamber.val")
-    assert result is cptA.val
-
-
-def test_find_any(registry):
+def test_find_any(registry, syngauss_factory):
     # Create an unregistered component
-    cptA = sim.SynGauss(
-        "I0",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={"ion_chamber"},
-    )
-    cptB = sim.SynGauss(
-        "It",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={"ion_chamber"},
-    )
-    cptC = sim.SynGauss(
-        "ion_chamber",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-    )
-    cptD = sim.SynGauss(
-        "sample motor",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={},
-    )
+    cptA = syngauss_factory("I0", ION_CHAMBER_LABELS)
+    cptB = syngauss_factory("It", ION_CHAMBER_LABELS)
+    cptC = syngauss_factory("ion_chamber")
+    cptD = syngauss_factory("sample motor")
     # Register the components
-    registry.register(cptA)
-    registry.register(cptB)
-    registry.register(cptC)
-    registry.register(cptD)
+    registry.register_many([cptA, cptB, cptC, cptD])
     # Only one match should work fine
     result = registry.findall(any_of="ion_chamber")
     assert cptA in result
@@ -252,7 +222,7 @@ def test_find_by_device(registry):
         center=-0.5,
         Imax=1,
         sigma=1,
-        labels={},
+        labels=NO_LABELS,
     )
     registry.register(cptD)
     # Pass the device itself to the find method
@@ -260,39 +230,13 @@ def test_find_by_device(registry):
     assert result is cptD
 
 
-def test_find_by_list_of_names(registry):
+def test_find_by_list_of_names(registry, syngauss_factory):
     """Will the findall() method handle lists of things to look up."""
     # Register a component
-    cptA = sim.SynGauss(
-        "sample motor A",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={},
-    )
-    cptB = sim.SynGauss(
-        "sample motor B",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={},
-    )
-    cptC = sim.SynGauss(
-        "sample motor C",
-        sim.motor,
-        "motor",
-        center=-0.5,
-        Imax=1,
-        sigma=1,
-        labels={},
-    )
-    registry.register(cptA)
-    registry.register(cptB)
-    registry.register(cptC)
+    cptA = syngauss_factory("sample motor A")
+    cptB = syngauss_factory("sample motor B")
+    cptC = syngauss_factory("sample motor C")
+    registry.register_many([cptA, cptB, cptC])
     # Pass the device names into the findall method
     result = registry.findall(["sample motor A", "sample motor B"])
     assert cptA in result
@@ -300,12 +244,17 @@ def test_find_by_list_of_names(registry):
     assert cptC not in result
 
 
-def test_user_readback(registry):
-    """Edge case where EpicsMotor.user_readback is named the same as the motor itself."""
-    device = sim.instantiate_fake_device(
+@pytest.fixture(scope="session")
+def fake_epics_motor():
+    """Instantiating fake devices is slow, so build this one only once."""
+    return sim.instantiate_fake_device(
         EpicsMotor, prefix="255idVME:m1", name="epics_motor"
     )
-    registry.register(device)
+
+
+def test_user_readback(registry, fake_epics_motor):
+    """Edge case where EpicsMotor.user_readback is named the same as the motor itself."""
+    registry.register(fake_epics_motor)
     # See if requesting the device.user_readback returns the proper signal
     registry.find("epics_motor_user_readback")
 
@@ -324,7 +273,7 @@ def test_auto_register():
         center=-0.5,
         Imax=1,
         sigma=1,
-        labels={"ion_chamber"},
+        labels=ION_CHAMBER_LABELS,
     )
     registry.find("I0")
     # Delete this registry to avoid warnings about duplicate entries
@@ -340,7 +289,7 @@ def test_clear(registry):
         center=-0.5,
         Imax=1,
         sigma=1,
-        labels={"ion_chamber"},
+        labels=ION_CHAMBER_LABELS,
     )
     registry.register(cpt)
     assert registry.find("I0") is cpt
@@ -359,7 +308,7 @@ def test_component_properties(registry):
         center=-0.5,
         Imax=1,
         sigma=1,
-        labels={"ion_chamber"},
+        labels=ION_CHAMBER_LABELS,
     )
     registry.register(I0)
     assert registry.device_names == {"I0"}
@@ -374,9 +323,7 @@ def test_component_properties(registry):
 
 
 def test_root_devices(registry):
-    registry.register(sim.motor1)
-    registry.register(sim.motor2)
-    registry.register(sim.motor3)
+    registry.register_many([sim.motor1, sim.motor2, sim.motor3])
     # Check that only root devices are returned
     root_devices = registry.root_devices
     assert len(root_devices) == 3
@@ -397,14 +344,16 @@ def test_duplicate_device(caplog, registry):
     motor2 = sim.instantiate_fake_device(EpicsMotor, prefix="", name="motor")
     # Set up logging so that we can know what
     caplog.clear()
-    with caplog.at_level(logging.DEBUG):
+    # Restrict DEBUG capture to this package so ophyd and friends don't
+    # format records we never inspect
+    with caplog.at_level(logging.DEBUG, logger="ophydregistry"):
         registry.register(motor1)
     # Check for the edge case where motor and motor.user_readback have the same name
     assert "Ignoring component with duplicate name" not in caplog.text
     assert "Ignoring readback with duplicate name" in caplog.text
     # Check that truly duplicated entries get a warning
     caplog.clear()
-    with caplog.at_level(logging.WARNING):
+    with caplog.at_level(logging.WARNING, logger="ophydregistry"):
         with pytest.warns(UserWarning):
             registry.register(motor2)
     # Check for the edge case where motor and motor.user_readback have the same name
@@ -485,20 +434,96 @@ def test_weak_references():
     registry.register(motor)
     # Can we still find the object if the test has a reference?
     assert registry.find("weak_motor") is motor
-    # Delete the original object
+    # Delete the original object. The device's parent/child cycle needs
+    # the collector, and a full collection is the only generation
+    # guaranteed to still hold it.
+    ref = weakref.ref(motor)
     del motor
     gc.collect()
+    assert ref() is None
     # Check that it's not in the registry anymore
     with pytest.raises(ComponentNotFound):
         registry.find("weak_motor")
 
 
-@pytest.fixture()
-def motors(mocker):
-    mocker.patch("ophyd.epics_motor.EpicsMotor.connected", new=True)
+def test_weak_references_label_cleanup():
+    """Check that labels whose devices have all been dropped don't
+    leave empty entries behind in the label table.
+
+    """
+    motor = sim.SynAxis(name="weak_label_motor", labels={"motors"})
+    registry = Registry(keep_references=False, auto_register=False)
+    registry.register(motor)
+    assert registry.find(label="motors") is motor
+    # Delete the original object
+    ref = weakref.ref(motor)
+    del motor
+    gc.collect()
+    assert ref() is None
+    # The label bucket should be gone, not just empty
+    assert "motors" not in registry._objects_by_label
+    with pytest.raises(ComponentNotFound):
+        registry.find(label="motors")
+
+
+def test_lazy_subsignals():
+    """Check that sub-components are registered on first lookup, not up front."""
+    registry = Registry(auto_register=False, lazy_subsignals=True)
+    motor = sim.SynAxis(name="lazy_motor")
+    registry.register(motor)
+    # Children are deferred until a query needs them
+    assert "lazy_motor_setpoint" not in registry.component_names
+    # A name query expands the matching tree
+    assert registry.find("lazy_motor_setpoint") is motor.setpoint
+    assert "lazy_motor_setpoint" in registry.component_names
+
+
+def test_lazy_subsignals_pop():
+    """Check that popping a lazy root also drops its deferred children."""
+    registry = Registry(auto_register=False, lazy_subsignals=True)
+    motor = sim.SynAxis(name="lazy_motor")
+    registry.register(motor)
+    popped = registry.pop("lazy_motor")
+    assert popped is motor
+    # The deferred tree went with its root
+    with pytest.raises(ComponentNotFound):
+        registry.find("lazy_motor_setpoint")
+
+
+def test_lazy_subsignals_full_expansion():
+    """Deferred children may carry labels or non-prefixed names, which
+    only a full expansion can see.
+
+    """
+    registry = Registry(auto_register=False, lazy_subsignals=True)
+    motor = sim.SynAxis(name="lazy_motor")
+    motor.setpoint.name = "oddly_named"
+    registry.register(motor)
+    # The name shares no prefix with its root, so a name-only query
+    # can't tell which tree to expand
+    with pytest.raises(ComponentNotFound):
+        registry.find(name="oddly_named")
+    # Label queries expand every deferred tree, after which the child
+    # is findable by name
+    assert registry.findall(label="spam", allow_none=True) == []
+    assert registry.find(name="oddly_named") is motor.setpoint
+
+
+@pytest.fixture(scope="module")
+def _motor_pair(module_mocker):
+    # PV parsing and Component walking make EpicsMotor construction
+    # expensive, so build the pair once per module
+    module_mocker.patch("ophyd.epics_motor.EpicsMotor.connected", new=True)
     good_motor = EpicsMotor("255idVME:m1", name="good_motor")
-    good_motor.connected = True
     bad_motor = EpicsMotor("255idVME:m2", name="bad_motor")
+    return (good_motor, bad_motor)
+
+
+@pytest.fixture()
+def motors(_motor_pair):
+    # Only the lightweight connection state is reset per test
+    good_motor, bad_motor = _motor_pair
+    good_motor.connected = True
     bad_motor.connected = False
     return (good_motor, bad_motor)
 
@@ -519,7 +544,7 @@ def test_pop_disconnected(registry, motors):
     assert registry["good_motor"] is good_motor
 
 
-def test_pop_disconnected_with_timeout(registry, motors):
+def test_pop_disconnected_with_timeout(registry, motors, monkeypatch):
     """Check that we can apply a timeout when waiting for disconnected
     devices.
 
@@ -529,15 +554,18 @@ def test_pop_disconnected_with_timeout(registry, motors):
     # Register the devices
     registry.register(good_motor)
     registry.register(bad_motor)
-
-    # Remove the devices with a timeout
-    def make_connected(dev, wait):
-        time.sleep(wait)
-        dev.connected = True
-
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        # Make the connection happen after 50 ms
-        executor.submit(make_connected, good_motor, 0.15)
-        registry.pop_disconnected(timeout=0.3)
+    # Drive the polling loop with a fake clock instead of burning real
+    # wall time in a background thread
+    clock = {"now": 0.0}
+
+    def fake_sleep(interval):
+        clock["now"] += interval
+        # The device comes online partway through the timeout window
+        if clock["now"] >= 0.15:
+            good_motor.connected = True
+
+    monkeypatch.setattr("ophydregistry.registry.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("ophydregistry.registry.time.sleep", fake_sleep)
+    registry.pop_disconnected(timeout=0.3)
     # Check that the connected device is still in the registry
     assert registry["good_motor"] is good_motor